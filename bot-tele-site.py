@@ -1,21 +1,29 @@
+from __future__ import annotations
+
 import os
-import json
 import asyncio
 import logging
+import bisect
+import hashlib
+import functools
 from pathlib import Path
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from io import BytesIO
+from typing import TYPE_CHECKING
 
-import feedparser
-from bs4 import BeautifulSoup
-
-# Telegram
-import telegram
+import orjson
 
-# Pillow + HTTP
-from PIL import Image, ImageOps
+# HTTP
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Heavy modules (telegram, lxml, selectolax, PIL, pic_scale, turbojpeg) are
+# imported where they are used, so a run with nothing new stays cheap.
+if TYPE_CHECKING:
+    import telegram
+    from PIL import Image
 
 # ====================
 # CONFIG
@@ -40,9 +48,13 @@ YOUTUBE_RSS_URL = f"https://www.youtube.com/feeds/videos.xml?channel_id={CHANNEL
 CRUNCHYROLL_LAST_FP_FILE = Path("last_crunchyroll_fp.txt")
 YOUTUBE_LAST_ID_FILE     = Path("last_youtube_id.txt")
 
+# Feed ETags (conditional GET)
+CRUNCHYROLL_ETAG_FILE = Path("last_cr_etag.txt")
+YOUTUBE_ETAG_FILE     = Path("last_yt_etag.txt")
+
 # Paths
 DATA_BASE    = Path("data")            # data/YYYY/MM/DD-MM.json
-GLOBAL_INDEX = Path("global_index")    # index_1.json, index_2.json, pagination.json, stats.json
+GLOBAL_INDEX = Path("global_index")    # index_N.json (+ index_N.ndjson), pagination.json, stats.json
 
 # Global Index settings
 GLOBAL_PAGE_SIZE = 500  # rotate after this many items per index file
@@ -58,8 +70,18 @@ MAX_IMAGE_WIDTH  = 1280
 MAX_IMAGE_HEIGHT = 1280
 JPEG_QUALITY     = 85
 WEBP_QUALITY     = 85
+WEBP_METHOD      = 4   # libwebp effort 0-6; 6 is much slower for ~no gain
 HTTP_TIMEOUT     = 25
 
+# Processed image cache (sha1(url) -> encoded JPEG/WEBP)
+IMAGE_CACHE_DIR       = Path("image_cache")
+IMAGE_CACHE_MAX_FILES = 64  # LRU by mtime
+
+# HTTP connection pool
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE     = 8
+HTTP_RETRIES          = 2
+
 # Logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
@@ -79,13 +101,25 @@ def daily_path(dt: datetime) -> Path:
     ensure_dir(out_dir)
     return out_dir / f"{d:02d}-{m:02d}.json"
 
+def _load(path: Path):
+    return orjson.loads(path.read_bytes())
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    """Write to a .tmp sibling then os.replace, so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _dump(path: Path, obj):
+    # orjson always emits UTF-8 (same output as ensure_ascii=False)
+    _write_bytes_atomic(path, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+
 def load_json_list(path: Path) -> list:
     if not path.exists():
         return []
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
+        data = _load(path)
+        return data if isinstance(data, list) else []
     except Exception as e:
         logging.error(f"Failed reading {path}: {e}")
         return []
@@ -93,8 +127,7 @@ def load_json_list(path: Path) -> list:
 def save_json_list(path: Path, data: list):
     try:
         ensure_dir(path.parent)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _dump(path, data)
     except Exception as e:
         logging.error(f"Failed writing {path}: {e}")
 
@@ -113,74 +146,138 @@ def write_text_file(path: Path, value: str):
     except Exception as e:
         logging.error(f"Failed writing {path}: {e}")
 
+def make_http_session() -> requests.Session:
+    """Shared keep-alive session (reuses TCP/TLS across requests)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=HTTP_RETRIES, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+_HTTP = make_http_session()
+
+
+# ====================
+# RSS parsing (lxml)
+# ====================
+RSS_NS = {
+    "atom":    "http://www.w3.org/2005/Atom",
+    "media":   "http://search.yahoo.com/mrss/",
+    "content": "http://purl.org/rss/1.0/modules/content/",
+    "yt":      "http://www.youtube.com/xml/schemas/2015",
+}
+
+@functools.lru_cache(maxsize=1)
+def _xml_parser():
+    from lxml import etree
+    return etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+
+def _xstr(node, path: str) -> str:
+    """First match of an XPath as a stripped string ('' if missing)."""
+    return node.xpath(f"string({path})", namespaces=RSS_NS).strip()
+
+def parse_rss(xml_bytes: bytes) -> list[dict]:
+    """
+    RSS 2.0 <item> / Atom <entry> -> list of dicts (feed order):
+    - title, link, id
+    - description, content (content:encoded, raw HTML)
+    - thumbnail (media:thumbnail/@url)
+    - categories
+    - video_id (yt:videoId)
+    """
+    if not xml_bytes:
+        return []
+    from lxml import etree
+    root = etree.fromstring(xml_bytes, parser=_xml_parser())
+    if root is None:
+        return []
+
+    entries = []
+    for node in root.xpath("//item | //atom:entry", namespaces=RSS_NS):
+        link = _xstr(node, "link") or _xstr(node, "atom:link[not(@rel) or @rel='alternate']/@href")
+        categories = [
+            str(c).strip()
+            for c in node.xpath("category/text() | atom:category/@term", namespaces=RSS_NS)
+            if str(c).strip()
+        ]
+        entries.append({
+            "title": _xstr(node, "title | atom:title"),
+            "link": link,
+            "id": _xstr(node, "guid | atom:id"),
+            "description": _xstr(node, "description | atom:summary | media:group/media:description"),
+            "content": _xstr(node, "content:encoded"),
+            "thumbnail": _xstr(node, ".//media:thumbnail/@url") or None,
+            "categories": categories,
+            "video_id": _xstr(node, "yt:videoId"),
+        })
+    return entries
+
+def fetch_feed(url: str, etag_file: Path | None = None) -> tuple[list[dict] | None, str | None]:
+    """
+    GET + parse a feed -> (entries, etag).
+    With etag_file: send If-None-Match and return (None, None) on 304 (not modified).
+    The new ETag is NOT saved here; the caller writes it once the entries are handled.
+    """
+    headers = {}
+    etag = read_text_file(etag_file) if etag_file else None
+    if etag:
+        headers["If-None-Match"] = etag
+    try:
+        r = _HTTP.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if r.status_code == 304:
+            return None, None
+        r.raise_for_status()
+        return parse_rss(r.content), r.headers.get("ETag", "")
+    except Exception as e:
+        logging.error(f"fetch_feed failed for {url}: {e}")
+        return [], None
+
 
 # ====================
 # RSS extraction helpers
 # ====================
-def extract_full_text(entry) -> str:
+def extract_full_text(entry: dict) -> str:
     """
     Full text without HTML:
-    - prefer content:encoded (entry.content[0].value)
+    - prefer content:encoded
     - fallback to description
     """
-    try:
-        if hasattr(entry, "content") and entry.content and isinstance(entry.content, list):
-            raw = entry.content[0].get("value") or ""
-            if raw:
-                return BeautifulSoup(raw, "html.parser").get_text(separator=" ", strip=True)
-    except Exception:
-        pass
-
-    raw = getattr(entry, "description", "") or ""
+    raw = entry.get("content") or entry.get("description") or ""
     if raw:
-        return BeautifulSoup(raw, "html.parser").get_text(separator=" ", strip=True)
-
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborHTMLParser(raw).text(separator=" ", strip=True)
     return ""
 
-def extract_image(entry) -> str | None:
+def extract_image(entry: dict) -> str | None:
     # 1) media:thumbnail
-    if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-        try:
-            return entry.media_thumbnail[0].get("url") or entry.media_thumbnail[0]["url"]
-        except Exception:
-            pass
+    if entry.get("thumbnail"):
+        return entry["thumbnail"]
     # 2) from content/description
-    raw = ""
-    try:
-        if hasattr(entry, "content") and entry.content and isinstance(entry.content, list):
-            raw = entry.content[0].get("value") or ""
-    except Exception:
-        pass
-    if not raw:
-        raw = getattr(entry, "description", "") or ""
+    raw = entry.get("content") or entry.get("description") or ""
     if raw:
-        soup = BeautifulSoup(raw, "html.parser")
-        img = soup.find("img")
-        if img and img.has_attr("src"):
-            return img["src"]
+        from selectolax.lexbor import LexborHTMLParser
+        img = LexborHTMLParser(raw).css_first("img[src]")
+        if img is not None:
+            return img.attributes.get("src")
     return None
 
-def extract_categories(entry) -> list:
-    cats = []
-    tags = getattr(entry, "tags", None)
-    if tags:
-        for t in tags:
-            term = getattr(t, "term", None)
-            if term:
-                cats.append(str(term))
-    return cats
+def extract_categories(entry: dict) -> list:
+    return list(entry.get("categories") or [])
 
-def build_daily_record(entry) -> dict:
+def build_daily_record(entry: dict, image: str | None) -> dict:
     """
     Daily record:
     - title
     - description_full (plain text)
-    - image
+    - image (precomputed extract_image(entry))
     - categories
     """
-    title = getattr(entry, "title", "") or ""
+    title = entry.get("title") or ""
     description_full = extract_full_text(entry)
-    image = extract_image(entry)
     categories = extract_categories(entry)
     return {
         "title": title,
@@ -189,21 +286,61 @@ def build_daily_record(entry) -> dict:
         "categories": categories
     }
 
-def get_entry_identity(entry) -> str:
-    """Dedup fingerprint: title + image."""
-    title = getattr(entry, "title", "") or ""
-    image = extract_image(entry)
+def get_entry_identity(entry: dict, image: str | None) -> str:
+    """Dedup fingerprint: title + image (precomputed extract_image(entry))."""
+    title = entry.get("title") or ""
     return f"{title.strip()}|{(image or '').strip()}"
 
 
 # ====================
 # Image processing (logo + resize)
 # ====================
+@functools.lru_cache(maxsize=1)
+def _pic_scale():
+    """Optional SIMD Lanczos backend (fast_image_resize); None -> Pillow."""
+    try:
+        from pic_scale import resize as ps_resize, Resampling
+        return ps_resize, Resampling
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _turbojpeg():
+    """Optional libjpeg-turbo encoder (SIMD DCT); None -> Pillow."""
+    try:
+        import numpy as np
+        from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+        tj = TurboJPEG()
+    except Exception as e:
+        # cached: logged once per process
+        logging.warning(f"turbojpeg unavailable, encoding JPEG with Pillow: {e}")
+        return None
+    return lambda rgb: tj.encode(np.asarray(rgb), quality=JPEG_QUALITY,
+                                 pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+
+def lanczos_resize(im: Image.Image, size: tuple) -> Image.Image:
+    """Lanczos resize via pic_scale when installed, else Pillow."""
+    from PIL import Image
+
+    backend = _pic_scale()
+    if backend is not None:
+        ps_resize, Resampling = backend
+        try:
+            return ps_resize(im, size, Resampling.LANCZOS, workers=0)
+        except Exception as e:
+            logging.warning(f"pic_scale resize failed, using Pillow: {e}")
+    return im.resize(size, Image.LANCZOS)
+
 def fetch_image(url: str) -> Image.Image | None:
+    from PIL import Image, ImageOps
     try:
-        r = requests.get(url, timeout=HTTP_TIMEOUT)
-        r.raise_for_status()
-        im = Image.open(BytesIO(r.content))
+        with _HTTP.get(url, timeout=HTTP_TIMEOUT, stream=True) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True  # undo gzip/deflate transfer encoding
+            # r.raw isn't seekable, so Pillow still buffers the body into a
+            # BytesIO internally; streaming only spares the r.content attribute
+            im = Image.open(r.raw)
+            im.load()
         im = ImageOps.exif_transpose(im)  # fix orientation
         return im.convert("RGBA")
     except Exception as e:
@@ -220,38 +357,59 @@ def downscale_to_fit(im: Image.Image) -> Image.Image:
     if scale < 1:
         new_w = max(1, int(w * scale))
         new_h = max(1, int(h * scale))
-        im = im.resize((new_w, new_h), Image.LANCZOS)
+        # alpha is dropped on export anyway; RGB is the fast SIMD path
+        im = lanczos_resize(im.convert("RGB"), (new_w, new_h))
     return im
 
-def overlay_logo(im: Image.Image) -> Image.Image:
-    """Overlay logo top-right with adaptive size."""
+def load_logo() -> Image.Image | None:
     if not Path(LOGO_PATH).exists():
-        return im
+        return None
+    from PIL import Image
     try:
         logo = Image.open(LOGO_PATH).convert("RGBA")
+        logo.load()
+        return logo
     except Exception as e:
         logging.error(f"Failed to open logo: {e}")
-        return im
+        return None
 
-    pw, _ = im.size
+# Opened once per process (on first use); resized copies are cached per target width
+@functools.lru_cache(maxsize=1)
+def _get_logo_rgba() -> Image.Image | None:
+    return load_logo()
+
+@functools.lru_cache(maxsize=16)
+def _get_logo_for_width(pw: int) -> Image.Image | None:
+    """Logo resized for an image of width pw (10% / 20% ratio buckets)."""
+    logo = _get_logo_rgba()
+    if logo is None:
+        return None
     lw_ratio = LOGO_MIN_WIDTH_RATIO if pw < 600 else LOGO_MAX_WIDTH_RATIO
     lw = int(max(1, min(pw - 2 * LOGO_MARGIN, pw * lw_ratio)))
     ratio = lw / logo.width
     lh = int(max(1, logo.height * ratio))
-    logo_resized = logo.resize((lw, lh), Image.LANCZOS)
+    return lanczos_resize(logo, (lw, lh))
+
+def overlay_logo(im: Image.Image) -> Image.Image:
+    """Overlay logo top-right with adaptive size."""
+    pw, _ = im.size
+    logo_resized = _get_logo_for_width(pw)
+    if logo_resized is None:
+        return im
 
+    lw = logo_resized.width
     x = pw - lw - LOGO_MARGIN
     y = LOGO_MARGIN
     im.paste(logo_resized, (x, y), logo_resized)
     return im
 
-def process_image_with_logo(url: str, out_format: str = "JPEG") -> BytesIO | None:
+def prepare_image(url: str) -> Image.Image | None:
     """
     - download
     - exif transpose
     - downscale
     - overlay logo
-    - export (JPEG or WEBP)
+    Returns an RGB image ready for export.
     """
     base = fetch_image(url)
     if base is None:
@@ -259,18 +417,80 @@ def process_image_with_logo(url: str, out_format: str = "JPEG") -> BytesIO | Non
 
     base = downscale_to_fit(base)
     base = overlay_logo(base)
+    return base.convert("RGB")
 
+def encode_image(rgb: Image.Image, out_format: str = "JPEG") -> BytesIO:
     out = BytesIO()
 
     fmt = out_format.upper().strip()
     if fmt == "WEBP":
-        base.convert("RGB").save(out, format="WEBP", quality=WEBP_QUALITY, method=6)
-    else:
-        base.convert("RGB").save(out, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+        rgb.save(out, format="WEBP", quality=WEBP_QUALITY, method=WEBP_METHOD)
+        out.seek(0)
+        return out
+
+    tj_encode = _turbojpeg()
+    if tj_encode is not None:
+        try:
+            out.write(tj_encode(rgb))
+            out.seek(0)
+            return out
+        except Exception as e:
+            logging.warning(f"turbojpeg encode failed, using Pillow: {e}")
+            out = BytesIO()
+
+    # single Huffman pass, 4:2:0 chroma
+    rgb.save(out, format="JPEG", quality=JPEG_QUALITY, optimize=False, subsampling=2)
 
     out.seek(0)
     return out
 
+def _img_cache_path(url: str, out_format: str) -> Path:
+    ext = "webp" if out_format.upper().strip() == "WEBP" else "jpeg"
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return IMAGE_CACHE_DIR / f"{key}.{ext}"
+
+def img_cache_get(url: str, out_format: str) -> BytesIO | None:
+    path = _img_cache_path(url, out_format)
+    if not path.exists():
+        return None
+    try:
+        data = path.read_bytes()
+        os.utime(path)  # mark as recently used
+        return BytesIO(data)
+    except Exception as e:
+        logging.error(f"Failed reading {path}: {e}")
+        return None
+
+def img_cache_put(url: str, out_format: str, buf: BytesIO):
+    path = _img_cache_path(url, out_format)
+    try:
+        ensure_dir(IMAGE_CACHE_DIR)
+        _write_bytes_atomic(path, buf.getvalue())
+        # evict least recently used beyond the cap
+        files = sorted(IMAGE_CACHE_DIR.glob("*.*"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in files[IMAGE_CACHE_MAX_FILES:]:
+            old.unlink(missing_ok=True)
+    except Exception as e:
+        logging.error(f"Failed writing {path}: {e}")
+
+def process_image_two_formats(url: str) -> tuple[BytesIO | None, BytesIO | None]:
+    """
+    Download/resize/overlay ONCE, then export both (cached by URL):
+    - JPEG (Telegram)
+    - WEBP (website)
+    """
+    jpg, webp = img_cache_get(url, "JPEG"), img_cache_get(url, "WEBP")
+    if jpg is not None and webp is not None:
+        return jpg, webp
+
+    rgb = prepare_image(url)
+    if rgb is None:
+        return None, None
+    jpg, webp = encode_image(rgb, "JPEG"), encode_image(rgb, "WEBP")
+    img_cache_put(url, "JPEG", jpg)
+    img_cache_put(url, "WEBP", webp)
+    return jpg, webp
+
 
 # ====================
 # Website uploader
@@ -313,7 +533,7 @@ def upload_article_to_site(
         files = {"image": ("article.webp", image_webp, "image/webp")}
 
     try:
-        r = requests.post(
+        r = _HTTP.post(
             SITE_API_URL,
             headers=headers,
             data=data,
@@ -335,69 +555,131 @@ def upload_article_to_site(
 # ====================
 # Persist Daily (Crunchyroll) - ONLY ONE
 # ====================
-def save_single_news(entry):
+def _fp_line(fp: str) -> str:
+    """Fingerprint as a single line for the .fps sidecar."""
+    return " ".join(fp.splitlines())
+
+def save_single_news(entry, fp: str, image: str | None):
     """
     Save ONLY 1 entry to today's JSON.
     Dedup by (title + image) within today's file.
+    Fingerprints are kept one-per-line in a DD-MM.fps sidecar.
+    fp/image: get_entry_identity(entry, image) / extract_image(entry), computed once by the caller.
     Return (record_or_none, day_path_str).
     """
     today = now_local()
     path = daily_path(today)
-    existing = load_json_list(path)
-
-    fp = get_entry_identity(entry)
-    existing_fp = {f"{(x.get('title') or '').strip()}|{(x.get('image') or '').strip()}" for x in existing}
+    fp_path = path.with_suffix(".fps")
 
+    if fp_path.exists():
+        existing_fp = set(fp_path.read_text(encoding="utf-8").splitlines())
+    else:
+        # first run on a day file written before the sidecar existed
+        existing_fp = {
+            _fp_line(f"{(x.get('title') or '').strip()}|{(x.get('image') or '').strip()}")
+            for x in load_json_list(path)
+        }
+        if existing_fp:
+            fp_path.write_text("".join(f + "\n" for f in existing_fp), encoding="utf-8")
+
+    fp = _fp_line(fp)
     if fp in existing_fp:
         return None, str(path)
 
-    rec = build_daily_record(entry)
+    rec = build_daily_record(entry, image)
+    existing = load_json_list(path)
     existing.append(rec)
     save_json_list(path, existing)
+    with open(fp_path, "a", encoding="utf-8") as f:
+        f.write(fp + "\n")
     return rec, str(path)
 
 
 # ====================
 # Manifests (month/year)
 # ====================
-def update_month_manifest(dt: datetime):
-    y, m = dt.year, dt.month
-    month_dir = DATA_BASE / f"{y}" / f"{m:02d}"
-    ensure_dir(month_dir)
-    manifest_path = month_dir / "month_manifest.json"
+def _load_manifest_section(path: Path, key: str) -> dict | None:
+    """Existing manifest[key], or None if missing/unreadable (-> full rescan)."""
+    if not path.exists():
+        return None
+    try:
+        section = _load(path).get(key)
+        return section if isinstance(section, dict) else None
+    except Exception as e:
+        logging.error(f"Failed reading {path}: {e}")
+        return None
 
+def insert_desc(section: dict, key: str, value: str) -> dict:
+    """
+    Set section[key] keeping keys ("DD"/"MM") in descending order.
+    section must already be descending; new keys are placed via bisect.
+    """
+    if key in section:
+        section[key] = value
+        return section
+    keys = list(section)
+    i = bisect.bisect_left([-int(k) for k in keys], -int(key))
+    keys.insert(i, key)
+    return {k: (value if k == key else section[k]) for k in keys}
+
+def scan_month_days(month_dir: Path) -> dict:
+    """Day files -> {"DD": path}, newest first."""
     days = {}
-    for p in sorted(month_dir.glob("*.json")):
+    for p in sorted(month_dir.glob("*.json"), reverse=True):
         if p.name == "month_manifest.json":
             continue
         day_key = p.stem  # "DD-MM"
         days[day_key.split("-")[0]] = str(p.as_posix())
+    return days
+
+def scan_year_months(year_dir: Path) -> dict:
+    """Month dirs -> {"MM": month_manifest path}, newest first."""
+    months = {}
+    for p in sorted(year_dir.glob("[0-1][0-9]"), reverse=True):
+        m = p.name
+        months[m] = f"{(p / 'month_manifest.json').as_posix()}"
+    return months
+
+def update_month_manifest(day_file: Path):
+    """
+    Patch the entry for day_file (data/YYYY/MM/DD-MM.json, as written by
+    save_single_news) into month_manifest.json (full scan only if it's missing).
+    """
+    month_dir = day_file.parent
+    ensure_dir(month_dir)
+    manifest_path = month_dir / "month_manifest.json"
+
+    days = _load_manifest_section(manifest_path, "days")
+    if days is None:
+        days = scan_month_days(month_dir)
+    else:
+        days = insert_desc(days, day_file.stem.split("-")[0], str(day_file.as_posix()))
 
     manifest = {
-        "year": str(y),
-        "month": f"{m:02d}",
-        "days": dict(sorted(days.items(), key=lambda kv: kv[0], reverse=True))
+        "year": month_dir.parent.name,
+        "month": month_dir.name,
+        "days": days
     }
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    _dump(manifest_path, manifest)
 
-def update_year_manifest(dt: datetime):
-    y = dt.year
-    year_dir = DATA_BASE / f"{y}"
+def update_year_manifest(day_file: Path):
+    """Patch the month of day_file into year_manifest.json (full scan only if it's missing)."""
+    month_dir = day_file.parent
+    year_dir = month_dir.parent
     ensure_dir(year_dir)
     manifest_path = year_dir / "year_manifest.json"
 
-    months = {}
-    for p in sorted(year_dir.glob("[0-1][0-9]")):
-        m = p.name
-        months[m] = f"{(p / 'month_manifest.json').as_posix()}"
+    months = _load_manifest_section(manifest_path, "months")
+    if months is None:
+        months = scan_year_months(year_dir)
+    else:
+        months = insert_desc(months, month_dir.name, f"{(month_dir / 'month_manifest.json').as_posix()}")
 
     manifest = {
-        "year": str(y),
-        "months": dict(sorted(months.items(), key=lambda kv: kv[0], reverse=True))
+        "year": year_dir.name,
+        "months": months
     }
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    _dump(manifest_path, manifest)
 
 
 # ====================
@@ -414,15 +696,13 @@ def gi_load_pagination():
     if not pag_path.exists():
         return {"total_articles": 0, "files": []}
     try:
-        with open(pag_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load(pag_path)
     except Exception:
         return {"total_articles": 0, "files": []}
 
 def gi_save_pagination(pag: dict):
     pag_path, _ = gi_paths()
-    with open(pag_path, "w", encoding="utf-8") as f:
-        json.dump(pag, f, ensure_ascii=False, indent=2)
+    _dump(pag_path, pag)
 
 def gi_save_stats(total_articles: int, added_today: int):
     _, stats_path = gi_paths()
@@ -431,51 +711,102 @@ def gi_save_stats(total_articles: int, added_today: int):
         "added_today": added_today,
         "last_update": now_local().isoformat()
     }
-    with open(stats_path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    _dump(stats_path, stats)
 
 def convert_full_to_slim(records: list, source_path: str = None) -> list:
     """
     From daily records to slim records for global index:
     Keep: title, image, categories, path (data/...json#idx)
     """
-    out = []
-    for i, r in enumerate(records):
-        path = f"{source_path}#{i}" if source_path else None
-        out.append({
+    return [
+        {
             "title": r.get("title"),
             "image": r.get("image"),
             "categories": r.get("categories") or [],
-            "path": path
-        })
-    return out
+            "path": f"{source_path}#{i}" if source_path else None
+        }
+        for i, r in enumerate(records)
+    ]
+
+def gi_page_lines_path(page_file: Path) -> Path:
+    """index_N.json -> index_N.ndjson (append-only source of the page)."""
+    return page_file.with_suffix(".ndjson")
+
+def gi_rebuild_page(page_file: Path):
+    """
+    Write the bracketed JSON view (index_N.json) from the page's NDJSON
+    lines without decoding them. Only needed when the view can't be patched.
+    """
+    lines_path = gi_page_lines_path(page_file)
+    lines = lines_path.read_bytes().splitlines() if lines_path.exists() else []
+    _write_bytes_atomic(page_file, b"[" + b",\n".join(lines) + b"]\n")
+
+def gi_append_page_view(page_file: Path, new_lines: list):
+    """
+    Append already-encoded records to the JSON view: copy its bytes minus the
+    trailing "]\n", add ",\n<lines>]\n" and write atomically (no JSON decode).
+    Falls back to gi_rebuild_page if the view is missing or not in that layout
+    (e.g. written by an older version).
+    """
+    data = page_file.read_bytes() if page_file.exists() else b""
+    if not data.endswith(b"]\n"):
+        gi_rebuild_page(page_file)
+        return
+    body = data[:-2]
+    sep = b"" if body == b"[" else b",\n"  # b"[]\n" = empty page
+    _write_bytes_atomic(page_file, body + sep + b",\n".join(new_lines) + b"]\n")
 
 def gi_append_records(new_records: list):
+    """
+    Records are appended to index_N.ndjson and copied onto the end of
+    index_N.json. pagination.json tracks the page's record count and
+    .ndjson size; if they disagree with the file (older version, or a crash
+    between the two writes) the count is redone and the view rebuilt.
+    """
     if not new_records:
         return
 
     pag = gi_load_pagination()
 
     if not pag["files"]:
-        first = GLOBAL_INDEX / "index_1.json"
-        save_json_list(first, [])
         pag["files"].append("index_1.json")
-
-    current_filename = pag["files"][-1]
-    current_file = GLOBAL_INDEX / current_filename
-    items = load_json_list(current_file)
-
-    if len(items) >= GLOBAL_PAGE_SIZE:
+        pag["current_file_count"] = 0
+
+    current_file = GLOBAL_INDEX / pag["files"][-1]
+    lines_path = gi_page_lines_path(current_file)
+    count = pag.get("current_file_count")
+
+    if not lines_path.exists():
+        # page written before NDJSON storage: seed it from the JSON view
+        items = load_json_list(current_file)
+        lines_path.write_bytes(b"".join(orjson.dumps(r) + b"\n" for r in items))
+        count = len(items)
+        gi_rebuild_page(current_file)
+    elif count is None or lines_path.stat().st_size != pag.get("current_file_bytes"):
+        recount = lines_path.read_bytes().count(b"\n")
+        if count is not None:
+            # records appended by a run that died before saving pagination
+            pag["total_articles"] = (pag.get("total_articles") or 0) + recount - count
+        count = recount
+        gi_rebuild_page(current_file)
+
+    if count >= GLOBAL_PAGE_SIZE:
         next_idx = len(pag["files"]) + 1
         current_filename = f"index_{next_idx}.json"
         current_file = GLOBAL_INDEX / current_filename
-        save_json_list(current_file, [])
+        lines_path = gi_page_lines_path(current_file)
+        lines_path.write_bytes(b"")
+        _write_bytes_atomic(current_file, b"[]\n")
         pag["files"].append(current_filename)
-        items = []
+        count = 0
 
-    items.extend(new_records)
-    save_json_list(current_file, items)
+    new_lines = [orjson.dumps(r) for r in new_records]
+    with open(lines_path, "ab") as f:
+        f.write(b"".join(line + b"\n" for line in new_lines))
+    gi_append_page_view(current_file, new_lines)
 
+    pag["current_file_count"] = count + len(new_lines)
+    pag["current_file_bytes"] = lines_path.stat().st_size
     total = (pag.get("total_articles") or 0) + len(new_records)
     pag["total_articles"] = total
 
@@ -486,13 +817,15 @@ def gi_append_records(new_records: list):
 # ====================
 # Telegram Senders
 # ====================
-async def send_crunchyroll_one(bot: telegram.Bot, entry):
-    rec = build_daily_record(entry)
+async def send_crunchyroll_one(bot: telegram.Bot, rec: dict, processed_jpg: BytesIO | None = None):
+    """
+    rec: daily record from save_single_news
+    processed_jpg: logo'd JPEG from process_image_two_formats (falls back to the raw image URL)
+    """
     title = rec.get("title") or ""
     img_url = rec.get("image")
 
     if img_url:
-        processed_jpg = process_image_with_logo(img_url, out_format="JPEG")
         try:
             if processed_jpg:
                 await bot.send_photo(chat_id=TELEGRAM_CHAT_ID, photo=processed_jpg, caption=title)
@@ -510,29 +843,30 @@ async def send_crunchyroll_one(bot: telegram.Bot, entry):
     await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=text)
 
 
-async def send_youtube_latest_if_new(bot: telegram.Bot):
+async def send_youtube_latest_if_new(bot: telegram.Bot, entries: list[dict]) -> bool:
     """
-    ONLY latest video:
+    ONLY latest video (entries: parsed YouTube feed, None = not modified):
     - if vid == last saved -> skip
     - else send & write last id
+    Returns False only if sending failed (entry must be retried).
     """
-    feed = feedparser.parse(YOUTUBE_RSS_URL)
-    if not feed.entries:
-        return
+    if entries is None:
+        logging.info("YT: feed not modified. Skip.")
+        return True
+    if not entries:
+        return True
 
-    entry = feed.entries[0]
-    vid = getattr(entry, "yt_videoid", None) or getattr(entry, "id", None) or ""
-    title = getattr(entry, "title", "") or ""
-    url   = getattr(entry, "link", "") or ""
+    entry = entries[0]
+    vid   = entry.get("video_id") or entry.get("id") or ""
+    title = entry.get("title") or ""
+    url   = entry.get("link") or ""
 
     last_vid = read_text_file(YOUTUBE_LAST_ID_FILE)
     if last_vid and vid and vid == last_vid:
         logging.info("YT: latest already sent. Skip.")
-        return
+        return True
 
-    thumb = None
-    if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-        thumb = entry.media_thumbnail[0].get("url")
+    thumb = entry.get("thumbnail")
 
     caption = f"🎥 {title}\n{url}"
     try:
@@ -542,10 +876,11 @@ async def send_youtube_latest_if_new(bot: telegram.Bot):
             await bot.send_message(chat_id=TELEGRAM_CHAT_ID, text=caption)
     except Exception as e:
         logging.error(f"Failed to send YouTube: {e}")
-        return
+        return False
 
     write_text_file(YOUTUBE_LAST_ID_FILE, vid)
     logging.info("YT: sent latest & saved id.")
+    return True
 
 
 # ====================
@@ -556,32 +891,44 @@ async def run():
         logging.error("FATAL: TELEGRAM_TOKEN or TELEGRAM_CHAT_ID not set.")
         return
 
+    # fetch both feeds concurrently (blocking HTTP in worker threads)
+    (news_entries, cr_etag), (yt_entries, yt_etag) = await asyncio.gather(
+        asyncio.to_thread(fetch_feed, CRUNCHYROLL_RSS_URL, CRUNCHYROLL_ETAG_FILE),
+        asyncio.to_thread(fetch_feed, YOUTUBE_RSS_URL, YOUTUBE_ETAG_FILE),
+    )
+    if news_entries is None and yt_entries is None:
+        logging.info("Both feeds not modified. Nothing to do.")
+        return
+
+    import telegram
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
 
     # 1) Crunchyroll: ONLY latest, ONLY if new -> send + save + index + upload to site
-    news_feed = feedparser.parse(CRUNCHYROLL_RSS_URL)
-    if news_feed.entries:
-        latest = news_feed.entries[0]
-        fp = get_entry_identity(latest)
+    if news_entries is None:
+        logging.info("Crun: feed not modified. Skip.")
+    elif news_entries:
+        latest = news_entries[0]
+        img_url = extract_image(latest)
+        fp = get_entry_identity(latest, img_url)
 
         last_fp = read_text_file(CRUNCHYROLL_LAST_FP_FILE)
         if last_fp and fp == last_fp:
             logging.info("Crun: latest already processed/sent. Skip.")
         else:
-            rec, day_path = save_single_news(latest)
+            rec, day_path = save_single_news(latest, fp, img_url)
 
             if rec is not None:
+                # image: process once -> JPEG (telegram) + WebP (site)
+                image_jpg, image_webp = process_image_two_formats(img_url) if img_url else (None, None)
+
                 # send telegram
-                await send_crunchyroll_one(bot, latest)
+                await send_crunchyroll_one(bot, rec, processed_jpg=image_jpg)
 
                 # upload to website (WebP)
                 title = rec.get("title") or ""
                 desc  = rec.get("description_full") or ""
                 time_str = now_local().isoformat()
 
-                img_url = rec.get("image")
-                image_webp = process_image_with_logo(img_url, out_format="WEBP") if img_url else None
-
                 upload_article_to_site(
                     title=title,
                     description=desc,
@@ -589,10 +936,9 @@ async def run():
                     image_webp=image_webp,
                 )
 
-                # manifests + global index
-                today = now_local()
-                update_month_manifest(today)
-                update_year_manifest(today)
+                # manifests + global index (for the day file the record landed in)
+                update_month_manifest(Path(day_path))
+                update_year_manifest(Path(day_path))
 
                 slim = convert_full_to_slim([rec], day_path)
                 gi_append_records(slim)
@@ -606,8 +952,13 @@ async def run():
     else:
         logging.warning("No entries in Crunchyroll feed.")
 
+    # feed handled (fp saved or skipped) -> safe to remember its ETag
+    if cr_etag is not None:
+        write_text_file(CRUNCHYROLL_ETAG_FILE, cr_etag)
+
     # 2) YouTube: ONLY latest, ONLY if new
-    await send_youtube_latest_if_new(bot)
+    if await send_youtube_latest_if_new(bot, yt_entries) and yt_etag is not None:
+        write_text_file(YOUTUBE_ETAG_FILE, yt_etag)
 
 
 if __name__ == "__main__":